@@ -1,5 +1,7 @@
 import logging
+from functools import lru_cache
 
+@lru_cache(maxsize=None)
 def get_logger(name: str = "Cost_opt" , level: str = "INFO"):
     logger = logging.getLogger(name)
     logger.propagate = False
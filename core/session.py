@@ -1,5 +1,7 @@
+import threading
 import boto3
-from typing import TYPE_CHECKING, overload, Literal
+from botocore.config import Config
+from typing import TYPE_CHECKING, Tuple, Optional, overload, Literal
 
 
 if TYPE_CHECKING:
@@ -9,38 +11,81 @@ if TYPE_CHECKING:
     from mypy_boto3_kms import KMSClient
 
 AWSService = Literal['ec2', 'rds','cloudwatch' , 'kms']
+AWS_SERVICES = ('ec2', 'rds', 'cloudwatch', 'kms')
+
+DEFAULT_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    retries={'mode': 'adaptive', 'max_attempts': 10},
+    tcp_keepalive=True
+)
 
 class AWSSessionManager:
     _instance = None
-    
+    _instance_lock = threading.Lock()
+
     def __init__(self):
-        self._session = {}
+        self._session = boto3.Session()
+        self._session.get_credentials()
+        self._clients = {}
+        self._regions = {}
+        self._lock = threading.Lock()
 
     @classmethod
     def get_instance(cls):
         if cls._instance is None:
-            cls._instance = cls()
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
         return cls._instance
 
-    def get_session(self, region: str = "us-east-1") -> boto3.Session:
-        if region not in self._session:
-            self._session[region] = boto3.Session(region_name=region)
-        return self._session[region]
+    def get_session(self) -> boto3.Session:
+        return self._session
+
+    def warm_up(self, services=AWS_SERVICES, region: str = "us-east-1") -> None:
+        for service_name in services:
+            self.get_client(service_name, region)
+
+    def get_regions(self, opt_in_only: bool = True) -> Tuple[str, ...]:
+        regions = self._regions.get(opt_in_only)
+        if regions is not None:
+            return regions
+
+        ec2 = self.get_client('ec2', 'us-east-1')
+        with self._lock:
+            regions = self._regions.get(opt_in_only)
+            if regions is None:
+                response = ec2.describe_regions(AllRegions=not opt_in_only)
+                regions = tuple(
+                    r['RegionName'] for r in response['Regions']
+                    if not opt_in_only or r['OptInStatus'] in ['opt-in-not-required', 'opted-in']
+                )
+                self._regions[opt_in_only] = regions
+        return regions
+
 
-    
     @overload
-    def get_client(self, service_name: Literal['ec2'], region: str = "us-east-1") -> "EC2Client": ...
+    def get_client(self, service_name: Literal['ec2'], region: str = "us-east-1", config: Optional[Config] = None) -> "EC2Client": ...
 
     @overload
-    def get_client(self, service_name: Literal['rds'], region: str = "us-east-1") -> "RDSClient": ...
+    def get_client(self, service_name: Literal['rds'], region: str = "us-east-1", config: Optional[Config] = None) -> "RDSClient": ...
 
 
     @overload
-    def get_client(self, service_name: Literal['cloudwatch'], region: str = "us-east-1") -> "CloudWatchClient": ...
+    def get_client(self, service_name: Literal['cloudwatch'], region: str = "us-east-1", config: Optional[Config] = None) -> "CloudWatchClient": ...
 
     @overload
-    def get_client(self, service_name: Literal['kms'], region: str = "us-east-1") -> "KMSClient": ...
+    def get_client(self, service_name: Literal['kms'], region: str = "us-east-1", config: Optional[Config] = None) -> "KMSClient": ...
+
+    def get_client(self, service_name: AWSService, region: str = "us-east-1", config: Optional[Config] = None):
+        key = (service_name, region, config)
+        client = self._clients.get(key)
+        if client is not None:
+            return client
 
-    def get_client(self, service_name: AWSService, region: str = "us-east-1"):
-        session = self.get_session(region)
-        return session.client(service_name)
\ No newline at end of file
+        client_config = DEFAULT_CLIENT_CONFIG.merge(config) if config else DEFAULT_CLIENT_CONFIG
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = self._session.client(service_name, region_name=region, config=client_config)
+                self._clients[key] = client
+        return client
\ No newline at end of file
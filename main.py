@@ -1,8 +1,11 @@
 import os
 import json
 import csv
+import threading
 from datetime import datetime
-from dataclasses import asdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, fields, is_dataclass
+from operator import attrgetter, itemgetter
 from core.logging import get_logger
 from core.session import AWSSessionManager
 
@@ -11,71 +14,92 @@ from services.EC2_cost_tool import ResourceInventoryManager
 from services.NAT_GW_cost_tool import run as runNAT
 from services.RDS_cost_tool import MultiRegionRDSCostAuditor, RDSConfig
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = get_logger('Service_report' , 'INFO')
 
+REPORT_BUFFER_SIZE = 1024 * 1024
+
+def _json_default(obj):
+    if is_dataclass(obj):
+        return asdict(obj)
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return str(obj)
+
+def _dump_json(item) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(item, default=_json_default)
+    return json.dumps(item, default=_json_default).encode('utf-8')
+
 class ReportGenerator:
     def __init__(self, output_dir="reports"):
         self.output_dir = output_dir
         if not os.path.exists(output_dir):
             os.makedirs(output_dir)
         self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self._lock = threading.Lock()
 
     def save_to_json(self, data, service_name):
         if not data: return
         filename = f"{self.output_dir}/{service_name}_{self.timestamp}.json"
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=4, default=str)
+        with self._lock, open(filename, 'wb', buffering=REPORT_BUFFER_SIZE) as f:
+            f.write(b"[\n")
+            for i, item in enumerate(data):
+                if i:
+                    f.write(b",\n")
+                f.write(_dump_json(item))
+            f.write(b"\n]\n")
         logger.info(f"JSON Report Completed: {filename}")
 
     def save_to_csv(self, data, service_name):
         if not data: return
         filename = f"{self.output_dir}/{service_name}_{self.timestamp}.csv"
-        keys = data[0].keys()
-        with open(filename, 'w', newline='', encoding='utf-8') as f:
-            dict_writer = csv.DictWriter(f, fieldnames=keys)
-            dict_writer.writeheader()
-            dict_writer.writerows(data)
+        if is_dataclass(data[0]):
+            keys = [f.name for f in fields(data[0])]
+            row_getter = attrgetter(*keys)
+        else:
+            keys = list(data[0].keys())
+            row_getter = itemgetter(*keys)
+        with self._lock, open(filename, 'w', newline='', encoding='utf-8', buffering=REPORT_BUFFER_SIZE) as f:
+            writer = csv.writer(f)
+            writer.writerow(keys)
+            writer.writerows(map(row_getter, data))
         logger.info(f"CSV Report Completed: {filename}")
 
-def run_rds(reporter):
+def run_rds(reporter, regions):
     logger.info("RDS Screening and Reporting Has Begun")
-    session_mgr = AWSSessionManager.get_instance()
-    ec2 = session_mgr.get_client('ec2', region='us-east-1')
-    all_regions = [r['RegionName'] for r in ec2.describe_regions()['Regions']]
-
-    config = RDSConfig(regions=all_regions, max_workers=12)
+    config = RDSConfig(regions=regions, max_workers=12)
     auditor = MultiRegionRDSCostAuditor(config)
     
-    rds_findings = auditor.run_parallel_audit()
-    
-    rds_data = [asdict(item) for item in rds_findings]
-    
-    reporter.save_to_json(rds_data, "RDS_Report")
-    reporter.save_to_csv(rds_data, "RDS_Report")
+    rds_findings = auditor.run_parallel_audit(display=False)
+
+    reporter.save_to_json(rds_findings, "RDS_Report")
+    reporter.save_to_csv(rds_findings, "RDS_Report")
 
-def run_ec2(reporter):
+def run_ec2(reporter, regions):
     logger.info("EC2 Screening and Reporting Has Begun")
     manager = ResourceInventoryManager()
-    findings = manager.run() 
-    manager.display_results(findings)
-    
+    findings = manager.run(regions=regions, display=False)
+
     reporter.save_to_json(findings, "EC2_Report")
     reporter.save_to_csv(findings, "EC2_Report")
 
-def run_kms(reporter):
+def run_kms(reporter, regions):
     logger.info("KMS Screening and Reporting Has Begun")
     collector = KMSCollector()
     
-    kms_findings = collector.run()
-    
-    kms_data = [asdict(item) for item in kms_findings]
-    
-    reporter.save_to_json(kms_data, "KMS_Report")
-    reporter.save_to_csv(kms_data, "KMS_Report")
+    kms_findings = collector.run(regions=regions, display=False)
 
-def run_nat(reporter):
+    reporter.save_to_json(kms_findings, "KMS_Report")
+    reporter.save_to_csv(kms_findings, "KMS_Report")
+
+def run_nat(reporter, regions):
     logger.info("NAT Gateway Screening and Reporting Has Begun")
-    nat_data = runNAT() 
+    nat_data = runNAT(regions=regions, display=False)
     
     if nat_data:
         reporter.save_to_json(nat_data, "NAT_GW_Report")
@@ -83,18 +107,25 @@ def run_nat(reporter):
 
 if __name__ == '__main__':
     reporter = ReportGenerator(output_dir="reports")
-    
-    print("\n" + "═"*70)
-    run_rds(reporter)
-    
-    print("\n" + "═"*70)
-    run_kms(reporter)
-    
-    print("\n" + "═"*70)
-    run_ec2(reporter)
-    
+    session_mgr = AWSSessionManager.get_instance()
+    session_mgr.warm_up()
+    regions = session_mgr.get_regions()
+
+    runners = [(run_rds, 'RDS'), (run_kms, 'KMS'), (run_ec2, 'EC2'), (run_nat, 'NAT Gateway')]
+
     print("\n" + "═"*70)
-    run_nat(reporter)
-    
+    with ThreadPoolExecutor(max_workers=len(runners)) as executor:
+        future_to_name = {
+            executor.submit(fn, reporter, regions): name
+            for fn, name in runners
+        }
+        for future in as_completed(future_to_name):
+            name = future_to_name[future]
+            try:
+                future.result()
+                logger.info(f"{name} scan finished")
+            except Exception as e:
+                logger.error(f"{name} scan failed: {e}")
+
     print("\n" + "═"*70)
-    logger.info("ALL SCANS COMPLETE. Reports are in the 'reports/' folder..")
\ No newline at end of file
+    logger.info("ALL SCANS COMPLETE. Reports are in the 'reports/' folder..")
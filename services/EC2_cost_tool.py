@@ -1,6 +1,6 @@
 import json
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Sequence
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from prettytable import PrettyTable
@@ -10,8 +10,31 @@ from utils.config import REGION_LOCATION_MAP
 
 logger = get_logger("Collector_ec2", "INFO")
 
+INSTANCE_PAGE_SIZE = 1000
+VOLUME_PAGE_SIZE = 500
+SNAPSHOT_PAGE_SIZE = 1000
 
-@dataclass
+BILLABLE_INSTANCE_STATES = ["pending", "running", "stopping", "stopped"]
+
+INSTANCE_PROJECTION = (
+    "Reservations[].Instances[].{id: InstanceId, type: InstanceType, state: State.Name, "
+    "launch_time: LaunchTime, platform: PlatformDetails, tags: Tags}"
+)
+VOLUME_PROJECTION = (
+    "Volumes[].{id: VolumeId, size: Size, type: VolumeType, state: State, "
+    "create_time: CreateTime, attached_to: Attachments[0].InstanceId, tags: Tags}"
+)
+SNAPSHOT_PROJECTION = (
+    "Snapshots[].{id: SnapshotId, size: VolumeSize, state: State, "
+    "start_time: StartTime, description: Description, tags: Tags}"
+)
+
+
+def _name_from_tags(tags) -> str:
+    return next((t["Value"] for t in tags or () if t["Key"] == "Name"), "N/A")
+
+
+@dataclass(slots=True)
 class ResourceInfo:
     service: str
     resource_id: str
@@ -22,17 +45,7 @@ class ResourceInfo:
     status: Optional[str] = None
     meta: Dict[str, Any] = field(default_factory=dict)
 
-    def to_dict(self):
-        return {
-            "service": self.service,
-            "resource_id": self.resource_id,
-            "name": self.name,
-            "region": self.region,
-            "size": self.size,
-            "create_time": self.create_time,
-            "status": self.status,
-            "meta": self.meta
-        }
+
 class EC2RegionCollector:
     
     def __init__(self, session_manager: AWSSessionManager):
@@ -48,11 +61,11 @@ class EC2RegionCollector:
 
         print(f"\rScanning region: {region}".ljust(60), end="", flush=True)
 
-        findings.extend(self._scan_instances(ec2_client, region))
-        findings.extend(self._scan_volumes(ec2_client, region))
-        findings.extend(self._scan_orphan_volumes(ec2_client, region))
-        findings.extend(self._scan_snapshots(ec2_client, region))
-        findings.extend(self._scan_eips(ec2_client, region))
+        scans = (self._scan_instances, self._scan_all_volumes, self._scan_snapshots, self._scan_eips)
+        with ThreadPoolExecutor(max_workers=len(scans)) as executor:
+            futures = [executor.submit(scan, ec2_client, region) for scan in scans]
+            for future in futures:
+                findings.extend(future.result())
 
         return findings
 
@@ -60,107 +73,89 @@ class EC2RegionCollector:
         findings = []
         try:
             paginator = ec2.get_paginator("describe_instances")
-            for page in paginator.paginate():
-                for reservation in page["Reservations"]:
-                    for instance in reservation["Instances"]:
-                        name = "N/A"
-                        for tag in instance.get("Tags", []):
-                            if tag["Key"] == "Name":
-                                name = tag["Value"]
-                                break
-                        
-                        findings.append(ResourceInfo(
-                            service="EC2",
-                            resource_id=instance["InstanceId"],
-                            name=name,
-                            region=region,
-                            size=instance["InstanceType"],
-                            create_time=instance.get("LaunchTime", "").strftime("%Y-%m-%d %H:%M:%S") if instance.get("LaunchTime") else "N/A",
-                            status=instance["State"]["Name"],
-                            meta={"platform": instance.get("PlatformDetails", "Linux")}
-                        ))
+            pages = paginator.paginate(
+                Filters=[{"Name": "instance-state-name", "Values": BILLABLE_INSTANCE_STATES}],
+                PaginationConfig={"PageSize": INSTANCE_PAGE_SIZE}
+            )
+            for instance in pages.search(INSTANCE_PROJECTION):
+                name = _name_from_tags(instance["tags"])
+                
+                findings.append(ResourceInfo(
+                    service="EC2",
+                    resource_id=instance["id"],
+                    name=name,
+                    region=region,
+                    size=instance["type"],
+                    create_time=instance["launch_time"].strftime("%Y-%m-%d %H:%M:%S") if instance["launch_time"] else "N/A",
+                    status=instance["state"],
+                    meta={"platform": instance["platform"] or "Linux"}
+                ))
         except Exception as e:
             logger.error(f"EC2 scan error in {region}: {e}")
         return findings
 
-    def _scan_volumes(self, ec2, region) -> List[ResourceInfo]:
+    def _scan_all_volumes(self, ec2, region) -> List[ResourceInfo]:
         findings = []
         try:
             paginator = ec2.get_paginator("describe_volumes")
-            for page in paginator.paginate(Filters=[{"Name": "status", "Values": ["in-use"]}]):
-                for vol in page["Volumes"]:
-                    name = "N/A"
-                    for tag in vol.get("Tags", []):
-                        if tag["Key"] == "Name":
-                            name = tag["Value"]
-                            break
-                    
-                    attached_to = "N/A"
-                    if vol.get("Attachments"):
-                        attached_to = vol["Attachments"][0].get("InstanceId", "N/A")
-                    
-                    findings.append(ResourceInfo(
-                        service="EBS Volume",
-                        resource_id=vol["VolumeId"],
-                        name=name,
-                        region=region,
-                        size=f"{vol['Size']} GB ({vol['VolumeType']})",
-                        create_time=vol.get("CreateTime", "").strftime("%Y-%m-%d %H:%M:%S") if vol.get("CreateTime") else "N/A",
-                        status=vol["State"],
-                        meta={"attached_to": attached_to}
-                    ))
-        except Exception as e:
-            logger.error(f"Volume scan error in {region}: {e}")
-        return findings
+            pages = paginator.paginate(
+                Filters=[{"Name": "status", "Values": ["in-use", "available"]}],
+                PaginationConfig={"PageSize": VOLUME_PAGE_SIZE}
+            )
+            for vol in pages.search(VOLUME_PROJECTION):
+                name = _name_from_tags(vol["tags"])
 
-    def _scan_orphan_volumes(self, ec2, region) -> List[ResourceInfo]:
-        findings = []
-        try:
-            paginator = ec2.get_paginator("describe_volumes")
-            for page in paginator.paginate(Filters=[{"Name": "status", "Values": ["available"]}]):
-                for vol in page["Volumes"]:
-                    name = "N/A"
-                    for tag in vol.get("Tags", []):
-                        if tag["Key"] == "Name":
-                            name = tag["Value"]
-                            break
-                    
+                create_time = vol["create_time"].strftime("%Y-%m-%d %H:%M:%S") if vol["create_time"] else "N/A"
+
+                if vol["state"] == "available":
                     findings.append(ResourceInfo(
                         service="Orphan Volume",
-                        resource_id=vol["VolumeId"],
+                        resource_id=vol["id"],
                         name=name,
                         region=region,
-                        size=f"{vol['Size']} GB ({vol['VolumeType']})",
-                        create_time=vol.get("CreateTime", "").strftime("%Y-%m-%d %H:%M:%S") if vol.get("CreateTime") else "N/A",
+                        size=f"{vol['size']} GB ({vol['type']})",
+                        create_time=create_time,
                         status="Available (Not Attached)",
-                        meta={"type": vol["VolumeType"]}
+                        meta={"type": vol["type"]}
                     ))
+                    continue
+
+                findings.append(ResourceInfo(
+                    service="EBS Volume",
+                    resource_id=vol["id"],
+                    name=name,
+                    region=region,
+                    size=f"{vol['size']} GB ({vol['type']})",
+                    create_time=create_time,
+                    status=vol["state"],
+                    meta={"attached_to": vol["attached_to"] or "N/A"}
+                ))
         except Exception as e:
-            logger.error(f"Orphan volume scan error in {region}: {e}")
+            logger.error(f"Volume scan error in {region}: {e}")
         return findings
 
     def _scan_snapshots(self, ec2, region) -> List[ResourceInfo]:
         findings = []
         try:
             paginator = ec2.get_paginator("describe_snapshots")
-            for page in paginator.paginate(OwnerIds=["self"]):
-                for snap in page["Snapshots"]:
-                    name = "N/A"
-                    for tag in snap.get("Tags", []):
-                        if tag["Key"] == "Name":
-                            name = tag["Value"]
-                            break
-                    
-                    findings.append(ResourceInfo(
-                        service="Snapshot",
-                        resource_id=snap["SnapshotId"],
-                        name=name,
-                        region=region,
-                        size=f"{snap['VolumeSize']} GB",
-                        create_time=snap.get("StartTime", "").strftime("%Y-%m-%d %H:%M:%S") if snap.get("StartTime") else "N/A",
-                        status=snap.get("State", "N/A"),
-                        meta={"description": snap.get("Description", "N/A")}
-                    ))
+            pages = paginator.paginate(
+                OwnerIds=["self"],
+                Filters=[{"Name": "status", "Values": ["completed"]}],
+                PaginationConfig={"PageSize": SNAPSHOT_PAGE_SIZE}
+            )
+            for snap in pages.search(SNAPSHOT_PROJECTION):
+                name = _name_from_tags(snap["tags"])
+                
+                findings.append(ResourceInfo(
+                    service="Snapshot",
+                    resource_id=snap["id"],
+                    name=name,
+                    region=region,
+                    size=f"{snap['size']} GB",
+                    create_time=snap["start_time"].strftime("%Y-%m-%d %H:%M:%S") if snap["start_time"] else "N/A",
+                    status=snap["state"] or "N/A",
+                    meta={"description": snap["description"] or "N/A"}
+                ))
         except Exception as e:
             logger.error(f"Snapshot scan error in {region}: {e}")
         return findings
@@ -173,11 +168,7 @@ class EC2RegionCollector:
                 status = "Attached" if addr.get("InstanceId") else "Detached"
                 attached_to = addr.get("InstanceId", "N/A")
                 
-                name = "N/A"
-                for tag in addr.get("Tags", []):
-                    if tag["Key"] == "Name":
-                        name = tag["Value"]
-                        break
+                name = _name_from_tags(addr.get("Tags"))
                 
                 findings.append(ResourceInfo(
                     service="Elastic IP",
@@ -198,21 +189,19 @@ class ResourceInventoryManager:
         self.session_manager = AWSSessionManager.get_instance()
         self.max_workers = max_workers
 
-    def get_regions(self) -> List[str]:
+    def get_regions(self) -> Sequence[str]:
         try:
-            ec2 = self.session_manager.get_client("ec2", "us-east-1")
-            response = ec2.describe_regions(AllRegions=False)
-            return [
-                r["RegionName"] for r in response["Regions"]
-                if r["OptInStatus"] in ["opt-in-not-required", "opted-in"]
-            ]
+            return self.session_manager.get_regions()
         except Exception as e:
             logger.error(f"Region list could not be retrieved.: {e}")
             return ["us-east-1"]
 
-    def run(self, target_region: Optional[str] = None) -> List[Dict]:
-        regions = [target_region] if target_region else self.get_regions()
-
+    def run(self, target_region: Optional[str] = None, regions: Optional[List[str]] = None,
+            display: bool = True) -> List[ResourceInfo]:
+        if target_region:
+            regions = [target_region]
+        elif not regions:
+            regions = self.get_regions()
 
         collector = EC2RegionCollector(self.session_manager)
         all_findings = []
@@ -227,23 +216,25 @@ class ResourceInventoryManager:
             for future in as_completed(future_to_region):
                 try:
                     result = future.result()
-                    all_findings.extend([f.to_dict() for f in result])
+                    all_findings.extend(result)
                 except Exception as e:
                     region = future_to_region[future]
                     logger.error(f"Region {region} taranırken hata: {e}")
 
         print("\n")  
         logger.info("Scan completed.")
+        if display:
+            self.display_results(all_findings)
         return all_findings
 
-    def display_results(self, findings: List[Dict]):
+    def display_results(self, findings: List[ResourceInfo]):
         if not findings:
             print("\n No resources found!")
             return
 
         services = {}
         for finding in findings:
-            service = finding["service"]
+            service = finding.service
             if service not in services:
                 services[service] = []
             services[service].append(finding)
@@ -258,15 +249,17 @@ class ResourceInventoryManager:
             table.align = "l"
             table.max_width = 30
             
-            for item in items:
-                table.add_row([
-                    item["region"],
-                    item["resource_id"],
-                    item["name"][:30] if item["name"] else "N/A",
-                    item["size"] if item["size"] else "N/A",
-                    item["create_time"] if item["create_time"] else "N/A",
-                    item["status"] if item["status"] else "N/A"
-                ])
+            table.add_rows([
+                [
+                    item.region,
+                    item.resource_id,
+                    item.name[:30] if item.name else "N/A",
+                    item.size if item.size else "N/A",
+                    item.create_time if item.create_time else "N/A",
+                    item.status if item.status else "N/A"
+                ]
+                for item in items
+            ])
             
             print(table)
 
@@ -278,17 +271,14 @@ class ResourceInventoryManager:
         summary_table.field_names = ["Resource Type", "Count"]
         summary_table.align = "l"
         
-        for service, items in sorted(services.items()):
-            summary_table.add_row([service, len(items)])
+        summary_table.add_rows([[service, len(items)] for service, items in sorted(services.items())])
         
         print(summary_table)
         print(f"\nTotal Resources: {len(findings)}")
 
 def run(region=None):
     manager = ResourceInventoryManager()
-    findings = manager.run(region)
-    manager.display_results(findings)
-    return findings
+    return manager.run(region)
 
 if __name__ == "__main__":
     run() 
\ No newline at end of file
@@ -1,13 +1,36 @@
+import os
 from core.logging import get_logger
 from core.session import AWSSessionManager
 from dataclasses import dataclass,field
 from prettytable import PrettyTable
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from concurrent.futures import ThreadPoolExecutor,as_completed
+from functools import cached_property
 from typing import Optional
 
-
-@dataclass
+DEFAULT_REGION_WORKERS = min(32, (os.cpu_count() or 4) * 5)
+KEY_WORKERS = 16
+KMS_CLIENT_CONFIG = Config(max_pool_connections=KEY_WORKERS * 2)
+AWS_MANAGED_ALIAS_PREFIX = "alias/aws/"
+ASYMMETRIC_KEY_PREFIXES = ("RSA_", "ECC_", "HMAC_")
+AWS_MANAGED_KEY_META = {
+    "key_state": "Enabled",
+    "key_usage": "ENCRYPT_DECRYPT",
+    "key_manager": "AWS",
+    "origin": "AWS_KMS",
+    "key_spec": "SYMMETRIC_DEFAULT",
+}
+ERROR_KEY_META = {
+    "key_state": "ERROR",
+    "key_usage": "UNKNOWN",
+    "key_manager": "UNKNOWN",
+    "origin": "UNKNOWN",
+    "key_spec": "UNKNOWN",
+}
+
+
+@dataclass(slots=True)
 class KMSFinding:
     region: str
     key_id: str
@@ -27,14 +50,26 @@ class KMSCollector:
     def __init__(self) -> None:
         self.manager = AWSSessionManager.get_instance()
         self.logger = get_logger('KMS_COLLECTOR' , 'INFO')
-        self.ec2 = self.manager.get_client('ec2')
-        self.kms = self.manager.get_client('kms')
-        self.table = PrettyTable(["Region", "Alias", "KeyId", "Mgr", "State", "Rotation", "Reason"])
+
+    @cached_property
+    def table(self) -> PrettyTable:
+        return PrettyTable(["Region", "Alias", "KeyId", "Mgr", "State", "Rotation", "Reason"])
 
     def get_regions(self):
-        
-        region = [r['RegionName'] for r in self.ec2.describe_regions()['Regions']]
-        return region
+        return self.manager.get_regions()
+
+    def _region_workers(self) -> int:
+        value = os.getenv('KMS_MAX_WORKERS')
+        if value is None:
+            return DEFAULT_REGION_WORKERS
+        try:
+            workers = int(value)
+        except ValueError:
+            workers = 0
+        if workers < 1:
+            self.logger.warning(f'Invalid KMS_MAX_WORKERS={value!r}, using {DEFAULT_REGION_WORKERS}')
+            return DEFAULT_REGION_WORKERS
+        return workers
 
     def get_rotation_status(self, kms_client ,key_id) -> Optional[bool]:
         try:
@@ -46,17 +81,14 @@ class KMSCollector:
             return None
 
 
-    def kms_alias(self,kms_client):
-
+    def kms_alias(self,kms_client) -> dict[str, list[str]]:
         alias_map = {}
-
         for page in kms_client.get_paginator('list_aliases').paginate():
-            for key in page['Aliases']:
-                target_key_id = key.get('TargetKeyId')
-                alias_name = key['AliasName']
-                if target_key_id and alias_name:
-                    alias_map[target_key_id] = alias_name
-        return  alias_map
+            for alias in page['Aliases']:
+                target_key_id = alias.get('TargetKeyId')
+                if target_key_id:
+                    alias_map.setdefault(target_key_id, []).append(alias['AliasName'])
+        return alias_map
 
 
     def describe_key_meta(self, kms_client, key_id: str) -> dict:
@@ -76,13 +108,7 @@ class KMSCollector:
         except ClientError as e:
             code = e.response["Error"]["Code"]
             self.logger.debug(f"describe_key failed for {key_id}: {code}")
-            return {
-                "key_state": "ERROR",
-                "key_usage": "UNKNOWN",
-                "key_manager": "UNKNOWN",
-                "origin": "UNKNOWN",
-                "key_spec": "UNKNOWN",
-            }
+            return ERROR_KEY_META
 
 
     def _short(self, s: str, head: int = 8, tail: int = 4) -> str:
@@ -91,6 +117,14 @@ class KMSCollector:
         return f"{s[:head]}...{s[-tail:]}"
 
 
+    def _rotation_display(self, finding: KMSFinding) -> str:
+        if finding.rotation_enabled is True:
+            return "ENABLED"
+        if finding.rotation_enabled is False:
+            return "DISABLED"
+        return "N/A"
+
+
     def rotation_applicability(self, meta: dict) -> tuple[bool, str]:
         key_manager = meta.get("key_manager")
         key_usage = meta.get("key_usage")
@@ -106,8 +140,7 @@ class KMSCollector:
         if origin == "EXTERNAL":
             return False, "IMPORTED_KEY_MATERIAL"
 
-        asymmetric_prefixes = ("RSA_", "ECC_", "HMAC_")
-        if isinstance(key_spec, str) and key_spec.startswith(asymmetric_prefixes):
+        if isinstance(key_spec, str) and key_spec.startswith(ASYMMETRIC_KEY_PREFIXES):
             return False, "ASYMMETRIC_OR_HMAC"
 
         return True, "APPLICABLE"
@@ -115,65 +148,90 @@ class KMSCollector:
         
     
     def list_keys(self,kms_client):
-        keys_list = []
         for page in kms_client.get_paginator('list_keys').paginate():
-            for key in page['Keys']:
-                keys_list.append(key)
-        return keys_list
+            yield from page['Keys']
+
+
+    def _process_key(self, kms_client, key: dict, alias: str, reg: str) -> KMSFinding:
+        key_id = key["KeyId"]
+        meta = self.describe_key_meta(kms_client, key_id)
+        applicable, rotation_reason = self.rotation_applicability(meta)
+
+        rotation = None
+        if applicable:
+            rotation = self.get_rotation_status(kms_client, key_id)
+            if rotation is True:
+                rotation_reason = "ENABLED"
+            elif rotation is False:
+                rotation_reason = "DISABLED"
+            else:
+                rotation_reason = "UNKNOWN_OR_NO_PERMISSION"
+
+        return KMSFinding(
+            region=reg,
+            key_id=key_id,
+            alias=alias,
+            key_arn=key["KeyArn"],
+            key_state=meta["key_state"],
+            key_usage=meta["key_usage"],
+            key_spec=meta["key_spec"],
+            key_manager=meta["key_manager"],
+            origin=meta["origin"],
+            rotation_enabled=rotation,
+            rotation_reason=rotation_reason,
+        )
 
 
     def scan_region(self, reg: str):
-        kms = self.manager.get_client("kms", region=reg)
-        findings: list[KMSFinding] = []
+        kms = self.manager.get_client("kms", region=reg, config=KMS_CLIENT_CONFIG)
 
         alias_map = self.kms_alias(kms)
-        keys = self.list_keys(kms)
-
-        for key in keys:
-            key_id = key["KeyId"]
-            key_arn = key["KeyArn"]
-            alias = alias_map.get(key_id, "No Alias")
-
-            meta = self.describe_key_meta(kms, key_id)
-            applicable, reason = self.rotation_applicability(meta)
-
-            rotation = None
-            rotation_reason = reason
-
-            if applicable:
-                rotation = self.get_rotation_status(kms, key_id)
-                if rotation is True:
-                    rotation_reason = "ENABLED"
-                elif rotation is False:
-                    rotation_reason = "DISABLED"
-                else:
-                    rotation_reason = "UNKNOWN_OR_NO_PERMISSION"
-
-            findings.append(
-                KMSFinding(
-                    region=reg,
-                    key_id=key_id,
-                    alias=alias,
-                    key_arn=key_arn,
-                    key_state=meta["key_state"],
-                    key_usage=meta["key_usage"],
-                    key_spec=meta["key_spec"],
-                    key_manager=meta["key_manager"],
-                    origin=meta["origin"],
-                    rotation_enabled=rotation,
-                    rotation_reason=rotation_reason,
-                )
-            )
+        findings: list[KMSFinding] = []
+        futures = []
+        executor = None
+
+        try:
+            for key in self.list_keys(kms):
+                alias = ", ".join(alias_map.get(key["KeyId"], ["No Alias"]))
+                if alias.startswith(AWS_MANAGED_ALIAS_PREFIX):
+                    findings.append(KMSFinding(
+                        region=reg,
+                        key_id=key["KeyId"],
+                        alias=alias,
+                        key_arn=key["KeyArn"],
+                        **AWS_MANAGED_KEY_META,
+                        rotation_reason="AWS_MANAGED",
+                    ))
+                    continue
+
+                if executor is None:
+                    executor = ThreadPoolExecutor(max_workers=KEY_WORKERS)
+                futures.append(executor.submit(self._process_key, kms, key, alias, reg))
+
+            findings.extend(future.result() for future in futures)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
 
         return findings
 
 
-        
-    def run(self):
+    def display_results(self, findings: list[KMSFinding]) -> None:
+        self.table.add_rows([
+            [
+                f.region, f.alias, self._short(f.key_id),
+                f.key_manager, f.key_state, self._rotation_display(f), f.rotation_reason
+            ]
+            for f in findings
+        ])
+        print(self.table)
+
+
+    def run(self, regions: Optional[list[str]] = None, display: bool = True):
         all_results = []  
         try:
-            regions = self.get_regions()
-            max_workers = 8
+            regions = regions or self.get_regions()
+            max_workers = self._region_workers()
             completed = 0
 
             with ThreadPoolExecutor(max_workers=max_workers) as executor:
@@ -196,22 +254,12 @@ class KMSCollector:
                         self.logger.exception(f'Unexpected error in region {reg}')
                         raise
 
-                    for f in findings:
-                        rotation_display = (
-                            "ENABLED" if f.rotation_enabled is True
-                            else "DISABLED" if f.rotation_enabled is False
-                            else "N/A"
-                        )
-                        self.table.add_row([
-                            f.region, f.alias, self._short(f.key_id),
-                            f.key_manager, f.key_state, rotation_display, f.rotation_reason
-                        ])
-
                     completed += 1
                     print(f"Progress: {completed}/{len(regions)} | Last finished: {reg}\x1b[K", end="\r")
 
             print() 
-            print(self.table)
+            if display:
+                self.display_results(all_results)
             return all_results 
 
         except KeyboardInterrupt:
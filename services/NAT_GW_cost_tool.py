@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Sequence
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
 from prettytable import PrettyTable
@@ -9,6 +9,10 @@ from core.logging import get_logger
 
 logger = get_logger("Collector_NAT", "INFO")
 
+TRAFFIC_METRICS = ('BytesInFromSource', 'BytesOutToDestination')
+METRIC_DATA_BATCH_SIZE = 500
+NAT_GATEWAY_PAGE_SIZE = 1000
+
 @dataclass
 class NATGatewayInfo:
     service: str
@@ -23,20 +27,6 @@ class NATGatewayInfo:
     public_ip: Optional[str] = None
     meta: Dict[str, Any] = field(default_factory=dict)
 
-    def to_dict(self):
-        return {
-            "service": self.service,
-            "resource_id": self.resource_id,
-            "name": self.name,
-            "region": self.region,
-            "vpc_id": self.vpc_id,
-            "subnet_id": self.subnet_id,
-            "state": self.state,
-            "create_time": self.create_time,
-            "traffic_gb": self.traffic_gb,
-            "public_ip": self.public_ip,
-            "meta": self.meta
-        }
 
 class NATGatewayCollector:
     
@@ -54,23 +44,28 @@ class NATGatewayCollector:
 
         print(f"\rScanning NAT Gateways in region: {region}".ljust(70), end="", flush=True)
 
-        findings.extend(self._scan_nat_gateways(ec2_client, cw_client, region))
+        now = datetime.now(timezone.utc)
+        findings.extend(self._scan_nat_gateways(ec2_client, cw_client, region, now))
 
         return findings
 
-    def _scan_nat_gateways(self, ec2, cw, region) -> List[NATGatewayInfo]:
+    def _scan_nat_gateways(self, ec2, cw, region, now: datetime) -> List[NATGatewayInfo]:
         findings = []
         try:
-            response = ec2.describe_nat_gateways()
-            
-            for nat_gw in response.get('NatGateways', []):
+            nat_gateways = [
+                nat_gw
+                for page in ec2.get_paginator('describe_nat_gateways').paginate(
+                    PaginationConfig={'PageSize': NAT_GATEWAY_PAGE_SIZE}
+                )
+                for nat_gw in page.get('NatGateways', [])
+            ]
+            traffic = self._get_traffic_metrics(cw, [nat_gw['NatGatewayId'] for nat_gw in nat_gateways], now, days=30)
+
+            for nat_gw in nat_gateways:
                 nat_id = nat_gw['NatGatewayId']
                 
-                name = "N/A"
-                for tag in nat_gw.get("Tags", []):
-                    if tag["Key"] == "Name":
-                        name = tag["Value"]
-                        break
+                tags = {tag["Key"]: tag["Value"] for tag in nat_gw.get("Tags", [])}
+                name = tags.get("Name", "N/A")
                 
                 public_ip = "N/A"
                 nat_addresses = nat_gw.get('NatGatewayAddresses', [])
@@ -81,12 +76,11 @@ class NATGatewayCollector:
                 if nat_gw.get('CreateTime'):
                     create_time = nat_gw['CreateTime'].strftime("%Y-%m-%d %H:%M:%S")
                 
-                traffic_gb = self._get_traffic_metrics(cw, nat_id, days=30)
+                traffic_gb = traffic.get(nat_id, 0.0)
                 
                 is_zombie = False
                 if nat_gw.get('CreateTime'):
-                    created_at = nat_gw['CreateTime'].replace(tzinfo=None)
-                    running_hours = (datetime.now(timezone.utc) - created_at).total_seconds() / 3600
+                    running_hours = (now - nat_gw['CreateTime']).total_seconds() / 3600
                     is_zombie = running_hours > 24 and traffic_gb < 1.0
                 
                 findings.append(NATGatewayInfo(
@@ -110,56 +104,66 @@ class NATGatewayCollector:
         
         return findings
 
-    def _get_traffic_metrics(self, cw, nat_gw_id: str, days: int = 30) -> float:
-        try:
-            end_time = datetime.now(timezone.utc)
-            start_time = end_time - timedelta(days=days)
+    def _get_traffic_metrics(self, cw, nat_gw_ids: List[str], now: datetime, days: int = 30) -> Dict[str, float]:
+        total_bytes = dict.fromkeys(nat_gw_ids, 0.0)
+        if not nat_gw_ids:
+            return total_bytes
 
-            total_bytes = 0
-            
-            for metric_name in ['BytesInFromSource', 'BytesOutToDestination']:
-                try:
-                    response = cw.get_metric_statistics(
-                        Namespace='AWS/NATGateway',
-                        MetricName=metric_name,
-                        Dimensions=[{'Name': 'NatGatewayId', 'Value': nat_gw_id}],
-                        StartTime=start_time,
-                        EndTime=end_time,
-                        Period=86400,  
-                        Statistics=['Sum']
-                    )
-                    
-                    if response.get('Datapoints'):
-                        total_bytes += sum(dp['Sum'] for dp in response['Datapoints'])
-                except Exception as e:
-                    logger.debug(f"Metric error for {nat_gw_id} - {metric_name}: {e}")
-            
-            total_gb = total_bytes / (1024 ** 3)
-            return round(total_gb, 2)
-        except Exception as e:
-            logger.error(f"Traffic metrics error for {nat_gw_id}: {e}")
-            return 0.0
+        start_time = now - timedelta(days=days)
+
+        query_targets = {}
+        queries = []
+        for nat_gw_id in nat_gw_ids:
+            for metric_name in TRAFFIC_METRICS:
+                query_id = f"m{len(queries)}"
+                query_targets[query_id] = nat_gw_id
+                queries.append({
+                    'Id': query_id,
+                    'MetricStat': {
+                        'Metric': {
+                            'Namespace': 'AWS/NATGateway',
+                            'MetricName': metric_name,
+                            'Dimensions': [{'Name': 'NatGatewayId', 'Value': nat_gw_id}]
+                        },
+                        'Period': days * 86400,
+                        'Stat': 'Sum'
+                    },
+                    'ReturnData': True
+                })
+
+        paginator = cw.get_paginator('get_metric_data')
+        for i in range(0, len(queries), METRIC_DATA_BATCH_SIZE):
+            batch = queries[i:i + METRIC_DATA_BATCH_SIZE]
+            try:
+                for page in paginator.paginate(MetricDataQueries=batch, StartTime=start_time, EndTime=now):
+                    for result in page['MetricDataResults']:
+                        total_bytes[query_targets[result['Id']]] += sum(result['Values'])
+            except Exception as e:
+                logger.error(f"Traffic metrics error for {len(batch)} NAT Gateway metric queries: {e}")
+
+        return {
+            nat_gw_id: round(value / (1024 ** 3), 2)
+            for nat_gw_id, value in total_bytes.items()
+        }
 
 class NATGatewayInventoryManager:
-    def __init__(self, max_workers=10):
+    def __init__(self, max_workers=32):
         self.session_manager = AWSSessionManager.get_instance()
         self.max_workers = max_workers
 
-    def get_regions(self) -> List[str]:
+    def get_regions(self) -> Sequence[str]:
         try:
-            ec2 = self.session_manager.get_client("ec2", "us-east-1")
-            response = ec2.describe_regions(AllRegions=False)
-            return [
-                r["RegionName"] for r in response["Regions"]
-                if r["OptInStatus"] in ["opt-in-not-required", "opted-in"]
-            ]
+            return self.session_manager.get_regions()
         except Exception as e:
             logger.error(f"Region list could not be retrieved.: {e}")
             return ["us-east-1"]
 
-    def run(self, target_region: Optional[str] = None) -> List[Dict]:
-
-        regions = [target_region] if target_region else self.get_regions()
+    def run(self, target_region: Optional[str] = None, regions: Optional[List[str]] = None,
+            display: bool = True) -> List[NATGatewayInfo]:
+        if target_region:
+            regions = [target_region]
+        elif not regions:
+            regions = self.get_regions()
 
         collector = NATGatewayCollector(self.session_manager)
         all_findings = []
@@ -174,16 +178,18 @@ class NATGatewayInventoryManager:
             for future in as_completed(future_to_region):
                 try:
                     result = future.result()
-                    all_findings.extend([f.to_dict() for f in result])
+                    all_findings.extend(result)
                 except Exception as e:
                     region = future_to_region[future]
                     logger.error(f"Region {region} taranırken hata: {e}")
 
         print("\n")  
         logger.info("NAT Gateway scan completed.")
+        if display:
+            self.display_results(all_findings)
         return all_findings
 
-    def display_results(self, findings: List[Dict]):
+    def display_results(self, findings: List[NATGatewayInfo]):
         if not findings:
             print("\n No NAT Gateways found!")
             return
@@ -208,25 +214,30 @@ class NATGatewayInventoryManager:
         table.max_width = 20
         
         zombie_count = 0
+        state_counts = {}
+        rows = []
         for item in findings:
-            status = " ZOMBIE" if item.get("meta", {}).get("is_zombie", False) else " Active"
-            if item.get("meta", {}).get("is_zombie", False):
+            is_zombie = item.meta.get("is_zombie", False)
+            if is_zombie:
                 zombie_count += 1
+            state = item.state
+            state_counts[state] = state_counts.get(state, 0) + 1
             
-            traffic = f"{item['traffic_gb']}" if item.get('traffic_gb') is not None else "N/A"
+            traffic = f"{item.traffic_gb}" if item.traffic_gb is not None else "N/A"
             
-            table.add_row([
-                item["region"],
-                item["resource_id"],
-                item["name"][:20] if item["name"] else "N/A",
-                item["vpc_id"],
-                item["public_ip"],
-                item["state"],
+            rows.append([
+                item.region,
+                item.resource_id,
+                item.name[:20] if item.name else "N/A",
+                item.vpc_id,
+                item.public_ip,
+                item.state,
                 traffic,
-                item["create_time"],
-                status
+                item.create_time,
+                " ZOMBIE" if is_zombie else " Active"
             ])
         
+        table.add_rows(rows)
         print(table)
 
         print(f"\n{'='*150}")
@@ -237,11 +248,6 @@ class NATGatewayInventoryManager:
         summary_table.field_names = ["Metric", "Count"]
         summary_table.align = "l"
         
-        state_counts = {}
-        for item in findings:
-            state = item.get("state", "unknown")
-            state_counts[state] = state_counts.get(state, 0) + 1
-        
         summary_table.add_row(["Total NAT Gateways", len(findings)])
         summary_table.add_row(["Zombie NAT Gateways (Low Traffic)", zombie_count])
         for state, count in sorted(state_counts.items()):
@@ -254,12 +260,9 @@ class NATGatewayInventoryManager:
             print("   Consider reviewing these for potential cost optimization.")
 
 
-def run(region=None):
+def run(region=None, regions=None, display=True):
     manager = NATGatewayInventoryManager()
-
-    findings = manager.run(region)
-    manager.display_results(findings)
-    return findings
+    return manager.run(region, regions=regions, display=display)
 
 if __name__ == "__main__":
     run()  
@@ -1,11 +1,14 @@
 import os
 import sys
-from typing import Set, Dict, List
-from dataclasses import dataclass, field
+import csv
+from typing import Set, Dict, List, Optional
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from collections import defaultdict
 from botocore.exceptions import ClientError
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
+from operator import attrgetter, itemgetter
 
 try:
     from prettytable import PrettyTable
@@ -20,6 +23,37 @@ except ImportError:
     print("ERROR: 'core' module not found. Please check project structure.")
     sys.exit(1)
 
+from utils.config import normalize_region
+
+RDS_PAGE_SIZE = 100
+
+DB_INSTANCE_PROJECTION = (
+    "DBInstances[].{id: DBInstanceIdentifier, status: DBInstanceStatus, instance_class: DBInstanceClass, "
+    "engine: Engine, storage: AllocatedStorage, storage_type: StorageType, iops: Iops, multi_az: MultiAZ, "
+    "encrypted: StorageEncrypted, availability_zone: AvailabilityZone, publicly_accessible: PubliclyAccessible, "
+    "backup_retention: BackupRetentionPeriod, auto_minor_version_upgrade: AutoMinorVersionUpgrade}"
+)
+DB_CLUSTER_PROJECTION = (
+    "DBClusters[].{id: DBClusterIdentifier, status: Status, engine: Engine, storage: AllocatedStorage, "
+    "encrypted: StorageEncrypted, multi_az: MultiAZ, cluster_members: length(DBClusterMembers || `[]`), "
+    "backup_retention: BackupRetentionPeriod, preferred_backup_window: PreferredBackupWindow, "
+    "deletion_protection: DeletionProtection}"
+)
+DB_SNAPSHOT_PROJECTION = (
+    "DBSnapshots[].{id: DBSnapshotIdentifier, source: DBInstanceIdentifier, storage: AllocatedStorage, "
+    "engine: Engine, status: Status, encrypted: Encrypted, create_time: SnapshotCreateTime, type: SnapshotType}"
+)
+CLUSTER_SNAPSHOT_PROJECTION = (
+    "DBClusterSnapshots[].{id: DBClusterSnapshotIdentifier, source: DBClusterIdentifier, storage: AllocatedStorage, "
+    "engine: Engine, status: Status, encrypted: StorageEncrypted, create_time: SnapshotCreateTime, type: SnapshotType}"
+)
+
+SNAPSHOT_FIELDS = itemgetter('id', 'source', 'storage', 'engine', 'status', 'encrypted', 'create_time', 'type')
+
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
 
 @dataclass
 class RDSConfig:
@@ -29,9 +63,11 @@ class RDSConfig:
     include_reserved: bool = True
     include_proxies: bool = True
     max_workers: int = 12
+    keep_items: bool = True
+    output_csv: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CostItem:
     region: str
     resource_type: str
@@ -44,10 +80,24 @@ class CostItem:
     encrypted: bool = False
     storage_type: str = ""
     iops: int = 0
-    additional_info: Dict = field(default_factory=dict)
+    availability_zone: str = ""
+    publicly_accessible: bool = False
+    auto_minor_version_upgrade: bool = False
+    backup_retention: int = 0
+    cluster_members: int = 0
+    preferred_backup_window: str = ""
+    deletion_protection: bool = False
+    source_instance: Optional[str] = None
+    source_cluster: Optional[str] = None
+    create_time: Optional[datetime] = None
     is_orphan: bool = False
 
 
+COST_ITEM_FIELDS = tuple(f.name for f in fields(CostItem))
+cost_item_row = attrgetter(*COST_ITEM_FIELDS)
+type_stat_fields = attrgetter('resource_type', 'size_gb', 'is_orphan')
+
+
 class RegionRDSAuditor:
     
     def __init__(self, region: str, config: RDSConfig):
@@ -64,213 +114,203 @@ class RegionRDSAuditor:
             'clusters': 0,
             'manual_snapshots': 0,
             'automated_snapshots': 0,
-            'cluster_snapshots': 0
+            'cluster_snapshots': 0,
+            'by_type': defaultdict(lambda: [0, 0.0, 0, 0.0])
         }
 
-    def scan_db_instances(self) -> None:
+    def scan_db_instances(self) -> List[CostItem]:
+        cost_items = []
         try:
             paginator = self.client.get_paginator('describe_db_instances')
+            pages = paginator.paginate(PaginationConfig={'PageSize': RDS_PAGE_SIZE})
             instance_count = 0
 
-            for page in paginator.paginate():
-                for instance in page['DBInstances']:
-                    instance_count += 1
-
-                    db_id = instance['DBInstanceIdentifier']
-                    status = instance['DBInstanceStatus']
-                    instance_class = instance.get('DBInstanceClass', 'N/A')
-                    engine = instance.get('Engine', 'N/A')
-                    allocated_storage = instance.get('AllocatedStorage', 0)
-                    storage_type = instance.get('StorageType', 'N/A')
-                    iops = instance.get('Iops', 0)
-                    multi_az = instance.get('MultiAZ', False)
-                    encrypted = instance.get('StorageEncrypted', False)
-
-                    self.active_instances.add(db_id)
-
-                    cost_item = CostItem(
-                        region=self.region,
-                        resource_type="DB Instance",
-                        resource_id=db_id,
-                        status=status,
-                        size_gb=float(allocated_storage),
-                        instance_class=instance_class,
-                        engine=engine,
-                        multi_az=multi_az,
-                        encrypted=encrypted,
-                        storage_type=storage_type,
-                        iops=iops,
-                        additional_info={
-                            'availability_zone': instance.get('AvailabilityZone', 'N/A'),
-                            'publicly_accessible': instance.get('PubliclyAccessible', False),
-                            'backup_retention': instance.get('BackupRetentionPeriod', 0),
-                            'auto_minor_version_upgrade': instance.get('AutoMinorVersionUpgrade', False)
-                        }
-                    )
-
-                    self.cost_items.append(cost_item)
+            for instance in pages.search(DB_INSTANCE_PROJECTION):
+                instance_count += 1
+                db_id = instance['id']
+                self.active_instances.add(db_id)
+
+                cost_item = CostItem(
+                    region=self.region,
+                    resource_type="DB Instance",
+                    resource_id=db_id,
+                    status=_intern(instance['status']),
+                    size_gb=float(instance['storage'] or 0),
+                    instance_class=_intern(instance['instance_class'] or 'N/A'),
+                    engine=_intern(instance['engine'] or 'N/A'),
+                    multi_az=instance['multi_az'] or False,
+                    encrypted=instance['encrypted'] or False,
+                    storage_type=_intern(instance['storage_type'] or 'N/A'),
+                    iops=instance['iops'] or 0,
+                    availability_zone=instance['availability_zone'] or 'N/A',
+                    publicly_accessible=instance['publicly_accessible'] or False,
+                    backup_retention=instance['backup_retention'] or 0,
+                    auto_minor_version_upgrade=instance['auto_minor_version_upgrade'] or False
+                )
+
+                cost_items.append(cost_item)
 
             self.stats['db_instances'] = instance_count
 
         except ClientError as e:
-            if e.response['Error']['Code'] != 'RequestExpired':
-                self.logger.error(f"[{self.region}] Instance scan error: {e}")
+            self.logger.error(f"[{self.region}] Instance scan error: {e}")
 
-    def scan_db_clusters(self) -> None:
-        if not self.config.include_clusters:
-            return
+        return cost_items
 
+    def scan_db_clusters(self) -> List[CostItem]:
+        cost_items = []
         try:
             paginator = self.client.get_paginator('describe_db_clusters')
+            pages = paginator.paginate(PaginationConfig={'PageSize': RDS_PAGE_SIZE})
             cluster_count = 0
 
-            for page in paginator.paginate():
-                for cluster in page['DBClusters']:
-                    cluster_count += 1
-
-                    cluster_id = cluster['DBClusterIdentifier']
-                    status = cluster['Status']
-                    engine = cluster.get('Engine', 'N/A')
-                    allocated_storage = cluster.get('AllocatedStorage', 0)
-                    storage_encrypted = cluster.get('StorageEncrypted', False)
-                    multi_az = cluster.get('MultiAZ', False)
-
-                    members = cluster.get('DBClusterMembers', [])
-                    member_count = len(members)
-
-                    self.active_clusters.add(cluster_id)
-
-                    cost_item = CostItem(
-                        region=self.region,
-                        resource_type="Aurora Cluster",
-                        resource_id=cluster_id,
-                        status=status,
-                        size_gb=float(allocated_storage),
-                        engine=engine,
-                        encrypted=storage_encrypted,
-                        multi_az=multi_az,
-                        additional_info={
-                            'cluster_members': member_count,
-                            'backup_retention': cluster.get('BackupRetentionPeriod', 0),
-                            'preferred_backup_window': cluster.get('PreferredBackupWindow', 'N/A'),
-                            'deletion_protection': cluster.get('DeletionProtection', False)
-                        }
-                    )
-
-                    self.cost_items.append(cost_item)
+            for cluster in pages.search(DB_CLUSTER_PROJECTION):
+                cluster_count += 1
+                cluster_id = cluster['id']
+                self.active_clusters.add(cluster_id)
+
+                cost_item = CostItem(
+                    region=self.region,
+                    resource_type="Aurora Cluster",
+                    resource_id=cluster_id,
+                    status=_intern(cluster['status']),
+                    size_gb=float(cluster['storage'] or 0),
+                    engine=_intern(cluster['engine'] or 'N/A'),
+                    encrypted=cluster['encrypted'] or False,
+                    multi_az=cluster['multi_az'] or False,
+                    cluster_members=cluster['cluster_members'],
+                    backup_retention=cluster['backup_retention'] or 0,
+                    preferred_backup_window=cluster['preferred_backup_window'] or 'N/A',
+                    deletion_protection=cluster['deletion_protection'] or False
+                )
+
+                cost_items.append(cost_item)
 
             self.stats['clusters'] = cluster_count
 
         except ClientError as e:
-            if e.response['Error']['Code'] != 'RequestExpired':
-                self.logger.error(f"[{self.region}] Cluster scan error: {e}")
-
-    def scan_snapshots(self) -> None:
-        if not self.config.include_snapshots:
-            return
-
-        safe_list = self.active_instances.union(self.active_clusters)
-
-        snapshot_types = ['manual', 'automated']
-        for snap_type in snapshot_types:
-            try:
-                paginator = self.client.get_paginator('describe_db_snapshots')
-                snapshot_count = 0
-
-                for page in paginator.paginate(SnapshotType=snap_type):
-                    for snapshot in page['DBSnapshots']:
-                        snapshot_count += 1
-
-                        snap_id = snapshot.get('DBSnapshotIdentifier')
-                        instance_id = snapshot.get('DBInstanceIdentifier')
-                        size = snapshot.get('AllocatedStorage', 0)
-                        engine = snapshot.get('Engine', 'N/A')
-                        status = snapshot.get('Status', 'N/A')
-                        encrypted = snapshot.get('Encrypted', False)
-                        create_time = snapshot.get('SnapshotCreateTime')
-
-                        is_orphan = instance_id not in safe_list
-                        if not snap_id:
-                            continue
-
-                        cost_item = CostItem(
-                            region=self.region,
-                            resource_type=f"Snapshot ({snap_type})",
-                            resource_id=snap_id,
-                            status=status,
-                            size_gb=float(size),
-                            engine=engine,
-                            encrypted=encrypted,
-                            is_orphan=is_orphan,
-                            additional_info={
-                                'source_instance': instance_id,
-                                'create_time': str(create_time) if create_time else 'N/A'
-                            }
-                        )
-
-                        self.cost_items.append(cost_item)
-
-                if snap_type == 'manual':
-                    self.stats['manual_snapshots'] = snapshot_count
-                else:
-                    self.stats['automated_snapshots'] = snapshot_count
-
-            except ClientError as e:
-                if e.response['Error']['Code'] != 'RequestExpired':
-                    self.logger.error(f"[{self.region}] Snapshot scan error ({snap_type}): {e}")
+            self.logger.error(f"[{self.region}] Cluster scan error: {e}")
+
+        return cost_items
 
+    def scan_db_snapshots(self) -> List[CostItem]:
+        cost_items = []
+        try:
+            paginator = self.client.get_paginator('describe_db_snapshots')
+            pages = paginator.paginate(PaginationConfig={'PageSize': RDS_PAGE_SIZE})
+            snapshot_counts = defaultdict(int)
+
+            for snap_id, source, storage, engine, status, encrypted, create_time, snap_type in map(
+                SNAPSHOT_FIELDS, pages.search(DB_SNAPSHOT_PROJECTION)
+            ):
+                snap_type = snap_type or 'manual'
+                # AWS Backup snapshots are kept until deleted, so count them with manual ones
+                snapshot_counts['automated' if snap_type == 'automated' else 'manual'] += 1
+                if not snap_id:
+                    continue
+
+                cost_item = CostItem(
+                    region=self.region,
+                    resource_type=_intern(f"Snapshot ({snap_type})"),
+                    resource_id=snap_id,
+                    status=_intern(status or 'N/A'),
+                    size_gb=float(storage or 0),
+                    engine=_intern(engine or 'N/A'),
+                    encrypted=encrypted or False,
+                    source_instance=source,
+                    create_time=create_time
+                )
+
+                cost_items.append(cost_item)
+
+            for snap_type, snapshot_count in snapshot_counts.items():
+                self.stats[f'{snap_type}_snapshots'] = snapshot_count
+
+        except ClientError as e:
+            self.logger.error(f"[{self.region}] Snapshot scan error: {e}")
+
+        return cost_items
+
+    def scan_cluster_snapshots(self) -> List[CostItem]:
+        cost_items = []
         try:
             paginator = self.client.get_paginator('describe_db_cluster_snapshots')
+            pages = paginator.paginate(PaginationConfig={'PageSize': RDS_PAGE_SIZE})
             cluster_snapshot_count = 0
 
-            for page in paginator.paginate():
-                for snapshot in page['DBClusterSnapshots']:
-                    cluster_snapshot_count += 1
-
-                    snap_id = snapshot.get('DBClusterSnapshotIdentifier')
-                    cluster_id = snapshot.get('DBClusterIdentifier')
-                    size = snapshot.get('AllocatedStorage', 0)
-                    engine = snapshot.get('Engine', 'N/A')
-                    status = snapshot.get('Status', 'N/A')
-                    encrypted = snapshot.get('StorageEncrypted', False)
-                    create_time = snapshot.get('SnapshotCreateTime')
-                    snap_type = snapshot.get('SnapshotType', 'manual')
-
-                    is_orphan = cluster_id not in safe_list
-
-                    if not snap_id:
-                        continue
-
-                    cost_item = CostItem(
-                        region=self.region,
-                        resource_type=f"Cluster Snapshot ({snap_type})",
-                        resource_id=snap_id,
-                        status=status,
-                        size_gb=float(size),
-                        engine=engine,
-                        encrypted=encrypted,
-                        is_orphan=is_orphan,
-                        additional_info={
-                            'source_cluster': cluster_id,
-                            'create_time': str(create_time) if create_time else 'N/A'
-                        }
-                    )
-
-                    self.cost_items.append(cost_item)
+            for snap_id, source, storage, engine, status, encrypted, create_time, snap_type in map(
+                SNAPSHOT_FIELDS, pages.search(CLUSTER_SNAPSHOT_PROJECTION)
+            ):
+                cluster_snapshot_count += 1
+                if not snap_id:
+                    continue
+
+                cost_item = CostItem(
+                    region=self.region,
+                    resource_type=_intern(f"Cluster Snapshot ({snap_type or 'manual'})"),
+                    resource_id=snap_id,
+                    status=_intern(status or 'N/A'),
+                    size_gb=float(storage or 0),
+                    engine=_intern(engine or 'N/A'),
+                    encrypted=encrypted or False,
+                    source_cluster=source,
+                    create_time=create_time
+                )
+
+                cost_items.append(cost_item)
 
             self.stats['cluster_snapshots'] = cluster_snapshot_count
 
         except ClientError as e:
-            if e.response['Error']['Code'] != 'RequestExpired':
-                self.logger.error(f"[{self.region}] Cluster snapshot scan error: {e}")
+            self.logger.error(f"[{self.region}] Cluster snapshot scan error: {e}")
+
+        return cost_items
+
+    def mark_orphan_snapshots(self, snapshots: List[CostItem]) -> None:
+        is_active = frozenset(self.active_instances.union(self.active_clusters)).__contains__
+
+        for item in snapshots:
+            item.is_orphan = not is_active(item.source_instance or item.source_cluster)
 
     def run_audit(self) -> tuple[List[CostItem], Dict]:
-        self.scan_db_instances()
-        self.scan_db_clusters()
-        self.scan_snapshots()
+        resource_scans = [self.scan_db_instances]
+        if self.config.include_clusters:
+            resource_scans.append(self.scan_db_clusters)
+
+        snapshot_scans = []
+        if self.config.include_snapshots:
+            snapshot_scans = [
+                self.scan_db_snapshots,
+                self.scan_cluster_snapshots
+            ]
+
+        with ThreadPoolExecutor(max_workers=len(resource_scans) + len(snapshot_scans)) as executor:
+            resource_futures = [executor.submit(scan) for scan in resource_scans]
+            snapshot_futures = [executor.submit(scan) for scan in snapshot_scans]
+
+            for future in resource_futures:
+                self.cost_items.extend(future.result())
+
+            snapshots = []
+            for future in snapshot_futures:
+                snapshots.extend(future.result())
+
+        self.mark_orphan_snapshots(snapshots)
+        self.cost_items.extend(snapshots)
+        self.update_type_stats(self.cost_items)
         
         return self.cost_items, self.stats
 
+    def update_type_stats(self, cost_items: List[CostItem]) -> None:
+        by_type = self.stats['by_type']
+        for resource_type, size, is_orphan in map(type_stat_fields, cost_items):
+            type_total = by_type[resource_type]
+            type_total[0] += 1
+            type_total[1] += size
+            if is_orphan:
+                type_total[2] += 1
+                type_total[3] += size
+
 
 class MultiRegionRDSCostAuditor:
     
@@ -288,7 +328,7 @@ class MultiRegionRDSCostAuditor:
             self.logger.error(f"Error scanning region {region}: {e}")
             return [], {}
 
-    def run_parallel_audit(self):
+    def run_parallel_audit(self, display: bool = True) -> List[CostItem]:
         print(f"\n{'═' * 80}")
         print(f"{'RDS MULTI-REGION COST AUDIT':^80}")
         print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S'):^80}")
@@ -297,7 +337,13 @@ class MultiRegionRDSCostAuditor:
         completed_regions = 0
         total_regions = len(self.config.regions)
 
-        with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
+        csv_file = None
+        if self.config.output_csv:
+            csv_file = open(self.config.output_csv, 'w', newline='', encoding='utf-8')
+            csv_writer = csv.writer(csv_file)
+            csv_writer.writerow(COST_ITEM_FIELDS)
+
+        with csv_file or nullcontext(), ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
             future_to_region = {
                 executor.submit(self.scan_region, region): region 
                 for region in self.config.regions
@@ -309,7 +355,10 @@ class MultiRegionRDSCostAuditor:
 
                 try:
                     cost_items, stats = future.result()
-                    self.all_cost_items.extend(cost_items)
+                    if csv_file:
+                        csv_writer.writerows(map(cost_item_row, cost_items))
+                    if self.config.keep_items:
+                        self.all_cost_items.extend(cost_items)
                     self.region_stats[region] = stats
                     
                     total_snaps = stats.get('manual_snapshots', 0) + stats.get('automated_snapshots', 0) + stats.get('cluster_snapshots', 0)
@@ -320,9 +369,11 @@ class MultiRegionRDSCostAuditor:
                     
                 except Exception as e:
                     print(f"\r[{completed_regions:2d}/{total_regions:2d}] {region:18} → ERROR", end="", flush=True)
-            return self.all_cost_items
+
         print("\n")
-        self.display_summary_tables()
+        if display:
+            self.display_summary_tables()
+        return self.all_cost_items
 
     def display_summary_tables(self) -> None:
         
@@ -332,25 +383,34 @@ class MultiRegionRDSCostAuditor:
         for field in region_table.field_names[1:]:
             region_table.align[field] = "r"
 
-        by_region = defaultdict(list)
-        for item in self.all_cost_items:
-            by_region[item.region].append(item)
-
-        for region in sorted(by_region.keys()):
-            items = by_region[region]
-            stats = self.region_stats.get(region, {})
-            total_size = sum(item.size_gb for item in items)
-            
-            region_table.add_row([
+        region_totals = {}
+        type_totals = defaultdict(lambda: [0, 0.0, 0, 0.0])
+        for region, stats in self.region_stats.items():
+            by_type = stats.get('by_type', {})
+            if not by_type:
+                continue
+            region_totals[region] = [
+                sum(total[0] for total in by_type.values()),
+                sum(total[1] for total in by_type.values())
+            ]
+            for resource_type, total in by_type.items():
+                type_total = type_totals[resource_type]
+                for i, value in enumerate(total):
+                    type_total[i] += value
+
+        region_table.add_rows([
+            [
                 region,
-                stats.get('db_instances', 0),
-                stats.get('clusters', 0),
-                stats.get('manual_snapshots', 0),
-                stats.get('automated_snapshots', 0),
-                stats.get('cluster_snapshots', 0),
-                len(items),
+                self.region_stats[region].get('db_instances', 0),
+                self.region_stats[region].get('clusters', 0),
+                self.region_stats[region].get('manual_snapshots', 0),
+                self.region_stats[region].get('automated_snapshots', 0),
+                self.region_stats[region].get('cluster_snapshots', 0),
+                item_count,
                 f"{total_size:.2f}"
-            ])
+            ]
+            for region, (item_count, total_size) in sorted(region_totals.items())
+        ])
 
         print(f"\n{'SUMMARY BY REGION':^80}")
         print(region_table)
@@ -361,40 +421,35 @@ class MultiRegionRDSCostAuditor:
         for field in type_table.field_names[1:]:
             type_table.align[field] = "r"
 
-        by_type = defaultdict(list)
-        for item in self.all_cost_items:
-            by_type[item.resource_type].append(item)
-
-        for resource_type in sorted(by_type.keys()):
-            items = by_type[resource_type]
-            total_size = sum(item.size_gb for item in items)
-            orphan_count = sum(1 for item in items if item.is_orphan)
-            orphan_size = sum(item.size_gb for item in items if item.is_orphan)
-
-            type_table.add_row([
+        type_table.add_rows([
+            [
                 resource_type,
-                len(items),
+                item_count,
                 f"{total_size:.2f}",
                 orphan_count if orphan_count > 0 else "-",
                 f"{orphan_size:.2f}" if orphan_size > 0 else "-"
-            ])
+            ]
+            for resource_type, (item_count, total_size, orphan_count, orphan_size) in sorted(type_totals.items())
+        ])
 
         print(f"\n{'SUMMARY BY RESOURCE TYPE':^80}")
         print(type_table)
 
-        total_storage = sum(item.size_gb for item in self.all_cost_items)
-        orphan_count_total = sum(1 for item in self.all_cost_items if item.is_orphan)
-        orphan_storage = sum(item.size_gb for item in self.all_cost_items if item.is_orphan)
+        total_storage = sum(total[1] for total in type_totals.values())
+        orphan_count_total = sum(total[2] for total in type_totals.values())
+        orphan_storage = sum(total[3] for total in type_totals.values())
 
         summary_table = PrettyTable()
         summary_table.field_names = ["Metric", "Value"]
         summary_table.align["Metric"] = "l"
         summary_table.align["Value"] = "r"
-        summary_table.add_row(["Total Regions", len(by_region)])
-        summary_table.add_row(["Total Resources", len(self.all_cost_items)])
-        summary_table.add_row(["Total Storage", f"{total_storage:.2f} GB"])
-        summary_table.add_row(["Orphan Resources", orphan_count_total])
-        summary_table.add_row(["Orphan Storage", f"{orphan_storage:.2f} GB"])
+        summary_table.add_rows([
+            ["Total Regions", len(region_totals)],
+            ["Total Resources", sum(total[0] for total in type_totals.values())],
+            ["Total Storage", f"{total_storage:.2f} GB"],
+            ["Orphan Resources", orphan_count_total],
+            ["Orphan Storage", f"{orphan_storage:.2f} GB"]
+        ])
 
         print(f"\n{'OVERALL SUMMARY':^80}")
         print(summary_table)
@@ -411,12 +466,9 @@ if __name__ == '__main__':
     regions_env = os.getenv('AWS_REGIONS', '')
     
     if regions_env == 'ALL':
-        session_mgr = AWSSessionManager.get_instance()
-        ec2_client = session_mgr.get_client('ec2', region='us-east-1')
-        response = ec2_client.describe_regions()
-        regions = [region['RegionName'] for region in response['Regions']]
+        regions = AWSSessionManager.get_instance().get_regions()
     elif regions_env:
-        regions = [r.strip() for r in regions_env.split(',')]
+        regions = [r for r in map(normalize_region, regions_env.split(',')) if r]
     else:
         regions = []
 
@@ -426,7 +478,9 @@ if __name__ == '__main__':
         include_snapshots=True,
         include_reserved=True,
         include_proxies=True,
-        max_workers=int(os.getenv('MAX_WORKERS', '5'))
+        max_workers=int(os.getenv('MAX_WORKERS', '5')),
+        keep_items=False,
+        output_csv=os.getenv('RDS_OUTPUT_CSV')
     )
 
     auditor = MultiRegionRDSCostAuditor(config)
@@ -1,4 +1,9 @@
-REGION_LOCATION_MAP = {
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Optional
+
+_REGION_LOCATION_MAP = {
     'us-east-1': 'US East (N. Virginia)',
     'us-east-2': 'US East (Ohio)',
     'us-west-1': 'US West (N. California)',
@@ -17,3 +22,10 @@ REGION_LOCATION_MAP = {
     'ap-south-1': 'Asia Pacific (Mumbai)'
 }
 
+REGION_LOCATION_MAP = MappingProxyType(_REGION_LOCATION_MAP)
+
+
+@lru_cache(maxsize=None)
+def normalize_region(region: str) -> Optional[str]:
+    code = region.strip().lower()
+    return sys.intern(code) if code else None